@@ -4,78 +4,118 @@ Algorithm: A* (A-Star) Search
 
 Description:
     Implements the A* search algorithm to find the shortest path on a grid
-    containing obstacles. It utilizes a Euclidean distance heuristic and
-    a priority queue to efficiently explore the search space.
+    containing obstacles. It utilizes an octile distance heuristic (matching
+    the 8-directional cost model) and a priority queue to efficiently
+    explore the search space.
 """
 
 import heapq
 import math
+from array import array
+from collections import deque
+
+# 8-directional movement offsets (row, col)
+_DR = (0, 0, 1, -1, 1, -1, -1, 1)
+_DC = (1, -1, 0, 0, 1, 1, -1, -1)
+
+# Step cost per offset: 1 for cardinal moves, sqrt(2) for diagonals
+_SQRT2 = math.sqrt(2)
+_STEP = tuple(_SQRT2 if dr and dc else 1.0 for dr, dc in zip(_DR, _DC))
+
+# (row offset, col offset, step cost) triples unpacked directly by the expansion loop
+_DIRS = tuple(zip(_DR, _DC, _STEP))
+
+# Octile distance: (dx + dy) + (sqrt(2) - 2) * min(dx, dy)
+_SQRT2_MINUS_2 = _SQRT2 - 2
 
 def heuristic(start, end):
-    """Euclidean distance heuristic for A*."""
-    return math.sqrt((start[0] - end[0]) ** 2 + (start[1] - end[1]) ** 2)
-
-def get_neighbors(position, grid):
-    """Returns valid neighbors (including diagonals) for a given position."""
-    row, col = position
-    # 8-directional movement
-    directions = [(0,1), (0,-1), (1,0), (-1,0), (1,1), (-1,1), (-1,-1), (1,-1)]
-    neighbors = []
-    
-    for row_dir, col_dir in directions:
-        new_row, new_col = row + row_dir, col + col_dir
-        
-        # Check bounds
-        if 0 <= new_row < len(grid) and 0 <= new_col < len(grid[0]):
-            # Check obstacles (False = Walkable, True = Obstacle)
-            if not grid[new_row][new_col]:
-                neighbors.append((new_row, new_col))
-    
-    return neighbors
+    """Octile distance heuristic for A* on an 8-connected grid."""
+    dx = abs(start[0] - end[0])
+    dy = abs(start[1] - end[1])
+    return (dx + dy) + _SQRT2_MINUS_2 * (dx if dx < dy else dy)
 
-def find_shortest_path(start, goal, grid):
-    # Validation: Check if start or end are obstacles
-    if grid[start[0]][start[1]] or grid[goal[0]][goal[1]]:
-        return None  
+def _astar(cells, cols, start_row, start_col, goal_row, goal_col):
+    """
+    Core A* loop over a flattened grid.
+
+    Nodes are identified by their flat index (row * cols + col), so scores
+    and parents live in compact index-addressed arrays instead of tuple-keyed
+    dicts. The grid must be padded with an obstacle border so that no
+    neighbour lookup can leave it. Returns the parent array, or None if
+    unreachable.
+    """
+    size = len(cells)
+    start = start_row * cols + start_col
+    goal = goal_row * cols + goal_col
+
+    # Typed arrays: unboxed doubles/ints instead of one Python object per cell
+    g_vals = array('d', [math.inf]) * size
+    parents = array('l', [-1]) * size
+
+    # Priority Queue stores: (F-Score, G-Score, NodeIndex)
+    goal_pos = (goal_row, goal_col)
+    queue = [(heuristic((start_row, start_col), goal_pos), 0, start)]
+    g_vals[start] = 0
+
+    # Per-solve offset table: each direction also carries its flat-index delta,
+    # so a neighbour's index is one addition away from the current node's
+    offsets = [(row_dir, col_dir, row_dir * cols + col_dir, step) for row_dir, col_dir, step in _DIRS]
 
-    # Priority Queue stores: (F-Score, G-Score, CurrentNode, ParentNode)
-    queue = []
-    heapq.heappush(queue, (heuristic(start, goal), 0, start, None))
-    
-    g_vals = {start: 0}
-    parents = {start: None}
-    visited_nodes = set()
-    
     while queue:
-        _, g, current_node, _ = heapq.heappop(queue)
-        
-        if current_node == goal:
-            # Reconstruct path backwards
-            path = []
-            while current_node:
-                path.append(current_node)
-                current_node = parents[current_node]
-            return path[::-1] # Reverse to get Start -> Goal
-        
-        if current_node in visited_nodes:
+        _, g, current = heapq.heappop(queue)
+
+        if current == goal:
+            return parents
+
+        # Stale entry: a cheaper route to this node was queued after it
+        if g > g_vals[current]:
             continue
-        
-        visited_nodes.add(current_node)
-        
-        for neighbor in get_neighbors(current_node, grid):
-            if neighbor in visited_nodes:
+
+        row, col = divmod(current, cols)
+
+        for row_dir, col_dir, delta, step in offsets:
+            neighbor = current + delta
+            # Check obstacles (the border makes this a bounds check too)
+            if cells[neighbor]:
                 continue
-            
-            # Cost to move to neighbor is always 1 (simplified cost)
-            tentative_g = g + 1  
-            
-            if neighbor not in g_vals or tentative_g < g_vals[neighbor]:
+
+            tentative_g = g + step
+
+            if tentative_g < g_vals[neighbor]:
                 g_vals[neighbor] = tentative_g
-                f_val = tentative_g + heuristic(neighbor, goal)
-                heapq.heappush(queue, (f_val, tentative_g, neighbor, current_node))
-                parents[neighbor] = current_node
-    
-    return None 
+                f_val = tentative_g + heuristic((row + row_dir, col + col_dir), goal_pos)
+                heapq.heappush(queue, (f_val, tentative_g, neighbor))
+                parents[neighbor] = current
+
+    return None
+
+def find_shortest_path(start, goal, grid):
+    # Validation: Check if start or end are obstacles
+    if grid[start[0]][start[1]] or grid[goal[0]][goal[1]]:
+        return None
+
+    rows, cols = len(grid), len(grid[0])
+    # Flatten the grid once (1 = Obstacle, 0 = Walkable) inside a one-cell
+    # obstacle border, so the search never needs a bounds check
+    width = cols + 2
+    cells = bytearray([1]) * (width * (rows + 2))
+    for r, row in enumerate(grid):
+        offset = (r + 1) * width + 1
+        cells[offset:offset + cols] = bytes(1 if cell else 0 for cell in row)
+
+    parents = _astar(cells, width, start[0] + 1, start[1] + 1, goal[0] + 1, goal[1] + 1)
+    if parents is None:
+        return None
+
+    # Reconstruct path from the goal, prepending so it reads Start -> Goal
+    # (shifting padded coordinates back by the border)
+    path = deque()
+    current = (goal[0] + 1) * width + goal[1] + 1
+    while current != -1:
+        row, col = divmod(current, width)
+        path.appendleft((row - 1, col - 1))
+        current = parents[current]
+    return list(path)
 
 if __name__ == '__main__':
     print("=== Heuristic Search Demo: A* Pathfinding ===")
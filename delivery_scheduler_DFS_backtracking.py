@@ -10,13 +10,18 @@ Description:
 """
 
 import math
+from itertools import groupby
 
 def euclid_distance(x1, y1, x2, y2):
     return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
-def dfs_backtracking(deliveries, visited, path_indices, arrival_times, evaluations, current_pos, current_time, depth, limit_reached):
+def dfs_backtracking(deliveries, visited_mask, path_indices, arrival_times, evaluations, current_pos, current_time, depth, limit_reached):
     """
     Standard DFS that tries branches in index order.
+
+    path_indices / arrival_times hold the route made so far (the first
+    `depth` entries). They are sized to len(deliveries) here, filled in
+    place on success, and trimmed back to `depth` entries on failure.
     """
     if evaluations >= 500000:
         if not limit_reached[0]:
@@ -24,108 +29,227 @@ def dfs_backtracking(deliveries, visited, path_indices, arrival_times, evaluatio
             limit_reached[0] = True
         return False, path_indices, arrival_times, evaluations
     
-    # Base Case: All deliveries made
-    if depth == len(deliveries):  
-        return True, path_indices, arrival_times, evaluations
+    n = len(deliveries)
+    root = depth
+    path_indices[root:] = [0] * (n - root)
+    arrival_times[root:] = [0.0] * (n - root)
+    found, evaluations = _dfs_stack(deliveries, visited_mask, path_indices, arrival_times, evaluations, current_pos, current_time, root)
+    if not found:
+        del path_indices[root:], arrival_times[root:]
+    return found, path_indices, arrival_times, evaluations
+
+def _dfs_stack(deliveries, visited_mask, path_indices, arrival_times, evaluations, current_pos, current_time, depth):
+    """
+    dfs_backtracking's search, run on an explicit stack instead of recursion.
+    `depth` is the stack pointer; frame d lives in per-depth buffers (visited
+    mask, position, time, and the candidate iterator it resumes from).
+    Returns (found, evaluations).
+    """
+    n = len(deliveries)
+    root = depth
+    sqrt = math.sqrt
+    # Pre-check slack per task, computed once for the whole search (see below)
+    tasks = [(i, x, y, deadline, abs(deadline) * 1e-12) for i, (x, y, deadline) in enumerate(deliveries)]
+    masks = [0] * (n + 1)
+    xs = [0.0] * (n + 1)
+    ys = [0.0] * (n + 1)
+    times = [0.0] * (n + 1)
+    candidates = [None] * (n + 1)
+    masks[depth] = visited_mask
+    xs[depth], ys[depth] = current_pos
+    times[depth] = current_time
+    candidates[depth] = iter(tasks)
     
-    for i in range(len(deliveries)):
-        if i not in visited:
+    while depth >= root:
+        # Base Case: All deliveries made
+        if depth == n:
+            return True, evaluations
+        
+        mask, cur_x, cur_y, cur_time = masks[depth], xs[depth], ys[depth], times[depth]
+        for i, x, y, deadline, slack in candidates[depth]:
+            if (mask >> i) & 1:
+                continue
             evaluations += 1
             
-            # Heuristic cutoff check again to catch deep recursion
+            # Cutoff check
             if evaluations >= 500000:
-                 return False, path_indices, arrival_times, evaluations
+                return False, evaluations
+            
+            dx, dy = x - cur_x, y - cur_y
+            budget = deadline - cur_time
             
-            x, y, deadline = deliveries[i]
-            travel_time = euclid_distance(current_pos[0], current_pos[1], x, y)
-            arrival_time = current_time + travel_time
+            # Squared pre-check rejects clear misses without a sqrt. budget can lose
+            # precision when deadline and current time are close, so the slack
+            # scales with the deadline; near-misses fall through to the exact test
+            reach = budget + slack
+            if budget < 0 or dx * dx + dy * dy > reach * reach:
+                continue
             
-            # Constraint Check: Can we meet the deadline?
+            # Constraint Check: Can we meet the deadline? Squares are taken with ** as
+            # in euclid_distance, since pow() and x * x can differ by an ulp
+            arrival_time = cur_time + sqrt(dx ** 2 + dy ** 2)
             if arrival_time <= deadline:
-                # Forward Step
-                visited.add(i)
-                path_indices.append(i + 1)
-                arrival_times.append(arrival_time)
+                # Forward Step (slot = depth)
+                path_indices[depth] = i + 1
+                arrival_times[depth] = arrival_time
                 
-                # Recursive Step
-                found, path_indices, arrival_times, evaluations = dfs_backtracking(
-                    deliveries, visited, path_indices, arrival_times, 
-                    evaluations, (x, y), arrival_time, depth + 1, limit_reached
-                )
-                
-                if found:
-                    return True, path_indices, arrival_times, evaluations
-                
-                # Backtracking Step
-                visited.remove(i)
-                path_indices.pop()
-                arrival_times.pop()
+                # "Recursive" Step: push the child frame; this frame's iterator
+                # resumes after i when the child is popped
+                depth += 1
+                masks[depth] = mask | (1 << i)
+                xs[depth], ys[depth], times[depth] = x, y, arrival_time
+                candidates[depth] = iter(tasks)
+                break
+        else:
+            # Backtracking Step: pop the frame; the depth slot is simply
+            # overwritten by the parent's next candidate
+            depth -= 1
     
-    return False, path_indices, arrival_times, evaluations
+    return False, evaluations
 
-def dfs_backtracking_ordered(deliveries, visited, path_indices, arrival_times, evaluations, current_pos, current_time, depth, limit_reached):
+def dfs_backtracking_ordered(deliveries, deadline_groups, fail_cache, visited_mask, path_indices, arrival_times, evaluations, current_pos, current_time, depth, limit_reached):
     """
     Optimized DFS that orders children by a Heuristic (Deadline, Distance).
+
+    deadline_groups holds the delivery indices pre-sorted by deadline and
+    grouped by equal deadline, so only ties need sorting (by distance) here.
+    fail_cache maps (visited_mask, last delivery) to the earliest time that
+    state was proven to have no completion; arriving no earlier also fails.
+    path_indices / arrival_times hold the route made so far (the first
+    `depth` entries). They are sized to len(deliveries) here, filled in
+    place on success, and trimmed back to `depth` entries on failure.
     """
     if evaluations >= 500000:
         return False, path_indices, arrival_times, evaluations
     
-    if depth == len(deliveries):  
-        return True, path_indices, arrival_times, evaluations
+    n = len(deliveries)
+    root = depth
+    path_indices[root:] = [0] * (n - root)
+    arrival_times[root:] = [0.0] * (n - root)
+    found, evaluations = _dfs_ordered_stack(deliveries, deadline_groups, fail_cache, visited_mask, path_indices, arrival_times, evaluations, current_pos, current_time, root)
+    if not found:
+        del path_indices[root:], arrival_times[root:]
+    return found, path_indices, arrival_times, evaluations
+
+def _dfs_ordered_stack(deliveries, deadline_groups, fail_cache, visited_mask, path_indices, arrival_times, evaluations, current_pos, current_time, depth):
+    """
+    dfs_backtracking_ordered's search, run on an explicit stack instead of
+    recursion. `depth` is the stack pointer; per-depth buffers hold the node
+    about to be opened and, once opened, its frame. Returns (found, evaluations).
+    """
+    n = len(deliveries)
+    root = depth
     
-    # Heuristic: Sort remaining tasks by (Deadline ASC, Distance ASC)
-    sorted_locations = sorted(
-        [i for i in range(len(deliveries)) if i not in visited],
-        key=lambda i: (
-            deliveries[i][2], # Primary: Deadline
-            euclid_distance(current_pos[0], current_pos[1], deliveries[i][0], deliveries[i][1]) # Secondary: Dist
-        )
-    )
+    # Travel times precomputed once: dist[a][b] from delivery a (or the
+    # starting point, row n) to delivery b
+    points = [(x, y) for x, y, _ in deliveries] + [tuple(current_pos)]
+    dist = [[euclid_distance(ax, ay, bx, by) for bx, by, _ in deliveries] for ax, ay in points]
+    # Cheapest way into each delivery from anywhere: reaching it costs at least this much
+    min_in = [min(dist[a][b] for a in range(n + 1) if a != b) for b in range(n)]
     
-    for i in sorted_locations:
-        evaluations += 1
-        if evaluations >= 500000:
-            return False, path_indices, arrival_times, evaluations
-            
-        x, y, deadline = deliveries[i]
-        travel_time = euclid_distance(current_pos[0], current_pos[1], x, y)
-        arrival_time = current_time + travel_time
+    # Per-depth state of a node about to be opened, then its frame once opened:
+    # (candidate iterator, tightest, runner_up, memo state, distance row, time)
+    masks = [0] * (n + 1)
+    rows = [None] * (n + 1)
+    times = [0.0] * (n + 1)
+    frames = [None] * (n + 1)
+    masks[depth], rows[depth], times[depth] = visited_mask, dist[n], current_time
+    opening = True
+    
+    while depth >= root:
+        mask = masks[depth]
         
-        if arrival_time <= deadline:
-            visited.add(i)
-            path_indices.append(i + 1)
-            arrival_times.append(arrival_time)
+        if opening:
+            opening = False
+            if depth == n:
+                return True, evaluations
+            dist_row, cur_time = rows[depth], times[depth]
             
-            found, path_indices, arrival_times, evaluations = dfs_backtracking_ordered(
-                deliveries, visited, path_indices, arrival_times, 
-                evaluations, (x, y), arrival_time, depth + 1, limit_reached
-            )
+            # Memo: current position is fixed by the last delivery made (0 = start)
+            state = (mask, path_indices[depth - 1] if depth else 0)
+            failed_at = fail_cache.get(state)
+            if failed_at is not None and failed_at <= cur_time:
+                depth -= 1
+                continue
             
-            if found:
-                return True, path_indices, arrival_times, evaluations
+            # Heuristic: Remaining tasks by (Deadline ASC, Distance ASC)
+            sorted_locations = []
+            for group in deadline_groups:
+                remaining = [i for i in group if not (mask >> i) & 1]
+                if len(remaining) > 1:
+                    # Secondary: Dist, only needed among tasks sharing a deadline
+                    remaining.sort(key=dist_row.__getitem__)
+                sorted_locations += remaining
             
-            visited.remove(i)
-            path_indices.pop()
-            arrival_times.pop()
+            # Branch-and-bound: no remaining task can be reached before cur_time,
+            # so a tightest deadline already in the past dooms the whole subtree
+            tightest = sorted_locations[0]
+            if cur_time > deliveries[tightest][2]:
+                depth -= 1
+                continue
+            
+            # Every remaining task must still be entered once, so even the best
+            # ordering finishes no earlier than this; prune if that misses the
+            # latest remaining deadline. The bound sums in a different order than
+            # a route accumulates arrival times, so allow for rounding at the boundary
+            latest = deliveries[sorted_locations[-1]][2]
+            if cur_time + sum(min_in[i] for i in sorted_locations) > latest + abs(latest) * 1e-12:
+                depth -= 1
+                continue
+            runner_up = sorted_locations[1] if len(sorted_locations) > 1 else None
+            frames[depth] = (iter(sorted_locations), tightest, runner_up, state, dist_row, cur_time)
+        
+        candidates, tightest, runner_up, state, dist_row, cur_time = frames[depth]
+        for i in candidates:
+            evaluations += 1
+            if evaluations >= 500000:
+                return False, evaluations
+            
+            arrival_time = cur_time + dist_row[i]
+            
+            if arrival_time <= deliveries[i][2]:
+                # Forward check: from i, the tightest other task must still be reachable in time.
+                # A route via other tasks can round an ulp below the direct leg, so allow slack
+                j = runner_up if i == tightest else tightest
+                if j is not None:
+                    j_deadline = deliveries[j][2]
+                    if arrival_time + dist[i][j] > j_deadline + abs(j_deadline) * 1e-12:
+                        continue
+                
+                path_indices[depth] = i + 1
+                arrival_times[depth] = arrival_time
+                
+                depth += 1
+                masks[depth], rows[depth], times[depth] = mask | (1 << i), dist[i], arrival_time
+                opening = True
+                break
+        else:
+            # Exhausted without hitting the cutoff: the state is proven infeasible
+            fail_cache[state] = cur_time
+            depth -= 1
     
-    return False, path_indices, arrival_times, evaluations
+    return False, evaluations
 
 def solve_schedule(start_pos, deliveries, use_ordered=False):
+    n = len(deliveries)
     path_indices = []
     arrival_times = []
     evaluations = 0
-    visited = set()
+    visited_mask = 0 # Bit i set = delivery i already scheduled
     limit_reached = [False] 
     
     if use_ordered:
         print("Running Optimized Search (Heuristic Ordered)...")
+        # Sort by deadline once; equal deadlines stay grouped for tie-breaking
+        order = sorted(range(n), key=lambda i: deliveries[i][2])
+        deadline_groups = [list(group) for _, group in groupby(order, key=lambda i: deliveries[i][2])]
         found, path_indices, arrival_times, evaluations = dfs_backtracking_ordered(
-            deliveries, visited, path_indices, arrival_times, evaluations, start_pos, 0, 0, limit_reached
+            deliveries, deadline_groups, {}, visited_mask, path_indices, arrival_times, evaluations, start_pos, 0, 0, limit_reached
         )
     else:
         print("Running Uninformed Search (Standard DFS)...")
         found, path_indices, arrival_times, evaluations = dfs_backtracking(
-            deliveries, visited, path_indices, arrival_times, evaluations, start_pos, 0, 0, limit_reached
+            deliveries, visited_mask, path_indices, arrival_times, evaluations, start_pos, 0, 0, limit_reached
         )
     
     if found:
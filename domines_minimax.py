@@ -10,16 +10,80 @@ Description:
 """
 
 import math
-import copy
+
+# Cache of per-shape tables: (rows, cols) -> (vert pairs, horz pairs, vert anchors, horz anchors)
+_SHAPE_TABLES = {}
+
+def _shape_tables(rows, cols):
+    """
+    Returns the two-cell bitmasks covered by a vertical / horizontal tile
+    anchored at each cell (index r * cols + c), plus the masks of cells that
+    can anchor each orientation at all (everything but the bottom row /
+    right column). Anchors whose tile would leave the board get a 0 pair.
+    """
+    key = (rows, cols)
+    if key not in _SHAPE_TABLES:
+        vert_pair = [0] * (rows * cols)
+        horz_pair = [0] * (rows * cols)
+        vert_anchors = horz_anchors = 0
+        for r in range(rows):
+            for c in range(cols):
+                bit = 1 << (r * cols + c)
+                if r + 1 < rows:
+                    vert_pair[r * cols + c] = bit | (bit << cols)
+                    vert_anchors |= bit
+                if c + 1 < cols:
+                    horz_pair[r * cols + c] = bit | (bit << 1)
+                    horz_anchors |= bit
+        _SHAPE_TABLES[key] = (tuple(vert_pair), tuple(horz_pair), vert_anchors, horz_anchors)
+    return _SHAPE_TABLES[key]
+
+class _SearchFrame:
+    """
+    One open node of DominoesGame.search. The window, next move index and
+    best value so far change as children return; the rest is fixed when
+    the node is opened (alpha_start / beta_start are the window the node
+    was searched with, used to classify its result for the table).
+    """
+    __slots__ = ('alpha', 'beta', 'next_i', 'v_best', 'move_best',
+                 'vertical', 'maximizing', 'depth', 'moves', 'key', 'alpha_start', 'beta_start')
+
+    def __init__(self, vertical, maximizing, depth, moves, key, alpha, beta):
+        self.alpha, self.beta = alpha, beta
+        self.next_i = 0
+        self.v_best = -math.inf if maximizing else math.inf
+        self.move_best = None
+        self.vertical, self.maximizing, self.depth = vertical, maximizing, depth
+        self.moves, self.key = moves, key
+        self.alpha_start, self.beta_start = alpha, beta
 
 class DominoesGame:
     def __init__(self, board):
-        self.board = board
         self.rows = len(board)
         self.cols = len(board[0]) if board else 0
+        self.vert_pair, self.horz_pair, self.vert_anchors, self.horz_anchors = _shape_tables(self.rows, self.cols)
+        
+        # Bitboard: bit (r * cols + c) set = cell occupied
+        self.mask = 0
+        for r, row in enumerate(board):
+            for c, occupied in enumerate(row):
+                if occupied:
+                    self.mask |= 1 << (r * self.cols + c)
+        
+        # Transposition table, reset by each get_best_move call:
+        # (mask, vertical, maximizing) -> (depth left, lower bound, upper bound, best move)
+        self.tt = {}
+        # Killer moves: ply -> last move that caused a cutoff there
+        self.killers = {}
 
     def get_board(self):
-        return self.board
+        """
+        Returns a snapshot of the board as a grid of booleans (True = occupied),
+        rebuilt from the bitboard. Editing it does not change the game; use
+        perform_move to place tiles.
+        """
+        return [[bool(self.mask >> (r * self.cols + c) & 1) for c in range(self.cols)]
+                for r in range(self.rows)]
 
     def is_legal_move(self, row, col, vertical):
         """Checks if a move is within bounds and on empty tiles."""
@@ -30,97 +94,196 @@ class DominoesGame:
         if vertical:
             if row + 1 >= self.rows or col >= self.cols:
                 return False
-            # Check if both tiles are empty (False means empty)
-            return not (self.board[row][col] or self.board[row+1][col])
+            # Check if both tiles are empty (no overlap with occupied bits)
+            return not (self.mask & self.vert_pair[row * self.cols + col])
         else:
             if row >= self.rows or col + 1 >= self.cols:
                 return False
-            return not (self.board[row][col] or self.board[row][col+1])
+            return not (self.mask & self.horz_pair[row * self.cols + col])
+
+    def free_anchor_bits(self, mask, vertical):
+        """Bitmask of anchor cells where a tile fits on the given bitboard."""
+        if vertical:
+            # Anchor and the cell below it (shifted up by one row) must be free
+            return ~mask & ~(mask >> self.cols) & self.vert_anchors
+        return ~mask & ~(mask >> 1) & self.horz_anchors
+
+    def legal_move_bits(self, vertical):
+        """Bitmask of anchor cells where the player can legally place a tile."""
+        return self.free_anchor_bits(self.mask, vertical)
 
     def legal_moves(self, vertical):
         """Generates a list of all valid coordinates for the current player."""
-        return [(r, c) for r in range(self.rows) 
-                for c in range(self.cols) 
-                if self.is_legal_move(r, c, vertical)]
+        moves = []
+        bits = self.legal_move_bits(vertical)
+        # Bit scan, lowest index first (same raster order as a row/col loop)
+        while bits:
+            low = bits & -bits
+            moves.append(divmod(low.bit_length() - 1, self.cols))
+            bits ^= low
+        return moves
+
+    def ordered_moves(self, vertical, maximizing, depth_left, priority_moves=()):
+        """
+        Legal moves sorted to maximize alpha-beta cutoffs. Each move is scored
+        by the mobility balance (moves killed vs. kept) it leaves for whoever
+        is to move at the depth limit, since that is whose utility the leaves
+        report; the best-looking move for this player comes first, ties in
+        raster order. priority_moves (transposition table move, killer move)
+        lead in the given order when legal.
+        """
+        pairs = self.vert_pair if vertical else self.horz_pair
+        leaf_vertical = vertical if depth_left % 2 == 0 else not vertical
+        scored = []
+        for move in self.legal_moves(vertical):
+            if move in priority_moves:
+                continue
+            after = self.mask | pairs[move[0] * self.cols + move[1]]
+            estimate = (self.free_anchor_bits(after, leaf_vertical).bit_count()
+                        - self.free_anchor_bits(after, not leaf_vertical).bit_count())
+            scored.append((-estimate if maximizing else estimate, move))
+        scored.sort(key=lambda item: item[0])
+        
+        leading = []
+        for move in priority_moves:
+            if move is not None and move not in leading and self.is_legal_move(move[0], move[1], vertical):
+                leading.append(move)
+        return leading + [move for _, move in scored]
 
     def perform_move(self, row, col, vertical):
         """Updates the board state with a move."""
-        self.board[row][col] = True
-        if vertical:
-            self.board[row+1][col] = True
-        else:
-            self.board[row][col+1] = True
+        pairs = self.vert_pair if vertical else self.horz_pair
+        self.mask |= pairs[row * self.cols + col]
+
+    def undo_move(self, row, col, vertical):
+        """Takes a move back off the board (the inverse of perform_move)."""
+        pairs = self.vert_pair if vertical else self.horz_pair
+        self.mask &= ~pairs[row * self.cols + col]
 
     def game_over(self, vertical):
         """Returns True if the current player has no legal moves."""
-        return not self.legal_moves(vertical)
-
-    def copy_game(self):
-        """Creates a deep copy of the game state for recursion."""
-        return DominoesGame(copy.deepcopy(self.board))
+        return not self.legal_move_bits(vertical)
 
     def utility(self, vertical):
         """
         Heuristic Evaluation Function:
         (My Moves) - (Opponent's Moves).
         """
-        return len(self.legal_moves(vertical)) - len(self.legal_moves(not vertical))
+        return self.legal_move_bits(vertical).bit_count() - self.legal_move_bits(not vertical).bit_count()
 
-    def max_value(self, vertical, alpha, beta, depth, limit, leaf_count):
-        """Maximizing player (AI) logic."""
+    def store_bounds(self, key, depth_left, value, move, alpha, beta):
+        """Records what a fail-soft search over (alpha, beta) proved about a position."""
+        if value <= alpha:
+            self.tt[key] = (depth_left, -math.inf, value, move) # Fail low: upper bound
+        elif value >= beta:
+            self.tt[key] = (depth_left, value, math.inf, move) # Fail high: lower bound
+        else:
+            self.tt[key] = (depth_left, value, value, move) # Exact
+
+    def open_node(self, stack, vertical, alpha, beta, depth, limit, leaf_count, maximizing):
+        """
+        Starts searching the position in self.mask. Returns (value, move,
+        leaf_count) when the transposition table or a leaf settles it at
+        once; otherwise pushes its frame onto stack and returns value None.
+        """
+        # Transposition lookup: bounds only transfer between searches of equal remaining depth
+        key = (self.mask, vertical, maximizing)
+        entry = self.tt.get(key)
+        if entry is not None and entry[0] == limit - depth:
+            _, lower, upper, move = entry
+            if lower >= beta or lower == upper:
+                return lower, move, leaf_count
+            if upper <= alpha:
+                return upper, move, leaf_count
+            alpha, beta = max(alpha, lower), min(beta, upper)
+        
         if self.game_over(vertical) or depth == limit:
-            return self.utility(vertical), None, leaf_count + 1
+            value = self.utility(vertical)
+            self.tt[key] = (limit - depth, value, value, None)
+            return value, None, leaf_count + 1
         
-        v_best = -math.inf
-        move_best = None
+        # A remembered best move from any depth is still a good first guess,
+        # followed by the last move that caused a cutoff at this ply
+        priority_moves = (entry[3] if entry else None, self.killers.get(depth))
+        moves = self.ordered_moves(vertical, maximizing, limit - depth, priority_moves)
         
-        for move in self.legal_moves(vertical):
-            row, col = move
-            new_game = self.copy_game()
-            new_game.perform_move(row, col, vertical)
-            
-            # Recursively call min_value for the opponent
-            v_curr, _, leaf_count = new_game.min_value(not vertical, alpha, beta, depth + 1, limit, leaf_count)
-            
-            if v_curr > v_best:
-                v_best, move_best = v_curr, move
+        stack.append(_SearchFrame(vertical, maximizing, depth, moves, key, alpha, beta))
+        return None, None, leaf_count
+
+    def search(self, vertical, alpha, beta, depth, limit, leaf_count, maximizing):
+        """
+        Alpha-Beta Minimax driven by an explicit stack of frames instead of
+        recursion. Moves are made on the board when descending and unmade
+        when the child finishes, leaving its value in `value` for the frame
+        below it (its parent) to fold in before trying its next move.
+        """
+        stack = []
+        value, move_best, leaf_count = self.open_node(stack, vertical, alpha, beta, depth, limit, leaf_count, maximizing)
+        
+        while stack:
+            frame = stack[-1]
+            moves = frame.moves
             
-            # Alpha-Beta Pruning
-            alpha = max(alpha, v_best)
-            if v_best >= beta:
-                return v_best, move_best, leaf_count
+            if value is not None:
+                # Unmake the move to the child just finished and fold in its value
+                move = moves[frame.next_i - 1]
+                self.undo_move(move[0], move[1], frame.vertical)
+                if frame.maximizing:
+                    if value > frame.v_best:
+                        frame.v_best, frame.move_best = value, move
+                    frame.alpha = max(frame.alpha, frame.v_best)
+                    cutoff = frame.v_best >= frame.beta
+                else:
+                    if value < frame.v_best:
+                        frame.v_best, frame.move_best = value, move
+                    frame.beta = min(frame.beta, frame.v_best)
+                    cutoff = frame.v_best <= frame.alpha
+                value = None
                 
-        return v_best, move_best, leaf_count
+                # Alpha-Beta Pruning
+                if cutoff:
+                    self.killers[frame.depth] = move
+                    frame.next_i = len(moves)
+            
+            if frame.next_i < len(moves):
+                # Descend into the next child
+                row, col = moves[frame.next_i]
+                frame.next_i += 1
+                self.perform_move(row, col, frame.vertical)
+                value, _, leaf_count = self.open_node(stack, not frame.vertical, frame.alpha, frame.beta,
+                                                      frame.depth + 1, limit, leaf_count, not frame.maximizing)
+            else:
+                # All children done (or cut off): record and return to the parent
+                stack.pop()
+                self.store_bounds(frame.key, limit - frame.depth, frame.v_best, frame.move_best,
+                                  frame.alpha_start, frame.beta_start)
+                value, move_best = frame.v_best, frame.move_best
+        
+        return value, move_best, leaf_count
+
+    def max_value(self, vertical, alpha, beta, depth, limit, leaf_count):
+        """Maximizing player (AI) logic."""
+        return self.search(vertical, alpha, beta, depth, limit, leaf_count, True)
 
     def min_value(self, vertical, alpha, beta, depth, limit, leaf_count):
         """Minimizing player (Opponent) logic."""
-        if self.game_over(vertical) or depth == limit:
-            return self.utility(vertical), None, leaf_count + 1
-        
-        v_best = math.inf
-        move_best = None
-        
-        for move in self.legal_moves(vertical):
-            row, col = move
-            new_game = self.copy_game()
-            new_game.perform_move(row, col, vertical)
-            
-            # Recursively call max_value for the AI
-            v_curr, _, leaf_count = new_game.max_value(not vertical, alpha, beta, depth + 1, limit, leaf_count)
-            
-            if v_curr < v_best:
-                v_best, move_best = v_curr, move
-            
-            # Alpha-Beta Pruning
-            beta = min(beta, v_best)
-            if v_best <= alpha:
-                return v_best, move_best, leaf_count
-                
-        return v_best, move_best, leaf_count
+        return self.search(vertical, alpha, beta, depth, limit, leaf_count, False)
 
     def get_best_move(self, vertical, limit):
-        """Root function to start the Minimax search."""
-        value, move, visited = self.max_value(vertical, -math.inf, math.inf, 0, limit, 0)
+        """
+        Root function to start the Minimax search, run as iterative deepening.
+        Leaves score utility() for the player to move there, so the objective
+        flips with the parity of the depth limit; passes therefore step by 2
+        (limit % 2, ..., limit - 2, limit) and each seeds the transposition
+        table's best moves and the killer moves for the next. Leaf counts
+        accumulate over all passes. Both tables start empty on every call, so
+        positions left behind by earlier moves do not pile up over a game.
+        """
+        self.tt.clear()
+        self.killers.clear()
+        visited = 0
+        for depth_limit in range(limit % 2, limit + 1, 2):
+            value, move, visited = self.max_value(vertical, -math.inf, math.inf, 0, depth_limit, visited)
         return move, value, visited
 
 def create_dominoes_game(rows, cols):